@@ -1,26 +1,11 @@
 from pathlib import Path
 from typing import Optional
 
-from huggingface_hub import snapshot_download
-from huggingface_hub.utils import validate_repo_id, HFValidationError
-
+from .. import hub
 from ..llm import Config
 from .llm import LLM
 
 
-def get_path_type(path: str) -> Optional[str]:
-    p = Path(path)
-    if p.is_file():
-        return "file"
-    elif p.is_dir():
-        return "dir"
-    try:
-        validate_repo_id(path)
-        return "repo"
-    except HFValidationError:
-        pass
-
-
 class AutoModelForCausalLM:
     @classmethod
     def from_pretrained(
@@ -29,6 +14,7 @@ class AutoModelForCausalLM:
         *,
         local_files_only: bool = False,
         revision: Optional[str] = None,
+        cache_dir: Optional[str] = None,
         **kwargs,
     ) -> LLM:
         """Loads the language model from a local file or remote repo.
@@ -40,6 +26,8 @@ class AutoModelForCausalLM:
             (i.e., do not try to download the model).
             revision: The specific model version to use. It can be a branch
             name, a tag name, or a commit id.
+            cache_dir: The path to a directory in which downloaded models are
+            cached. Default is the Hugging Face Hub cache directory.
 
         Returns:
             `LLM` object.
@@ -52,7 +40,7 @@ class AutoModelForCausalLM:
                 )
             setattr(config, k, v)
 
-        path_type = get_path_type(model_path_or_repo_id)
+        path_type = hub.get_path_type(model_path_or_repo_id)
         if not path_type:
             raise ValueError(f"Model path '{model_path_or_repo_id}' doesn't exist.")
 
@@ -62,10 +50,21 @@ class AutoModelForCausalLM:
         elif path_type == "dir":
             model_path = Path(model_path_or_repo_id)
         elif path_type == "repo":
-            model_path = snapshot_download(
+            # Only download the files used by `LLM`.
+            if local_files_only:
+                model_file = "*.safetensors"
+            else:
+                model_file = hub.AutoModelForCausalLM._find_model_file_from_repo(
+                    repo_id=model_path_or_repo_id,
+                    revision=revision,
+                    extensions=(".safetensors",),
+                )
+            model_path = hub._cached_snapshot_download(
                 repo_id=model_path_or_repo_id,
+                allow_patterns=["config.json", "tokenizer.model", model_file],
                 local_files_only=local_files_only,
                 revision=revision,
+                cache_dir=cache_dir,
             )
 
         return LLM(model_path=model_path, config=config)
@@ -1,20 +1,53 @@
 import json
+import os
+import stat
 from dataclasses import dataclass
+from importlib.metadata import PackageNotFoundError, version
+from importlib.util import find_spec
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Tuple, Union
 
-from huggingface_hub import HfApi, snapshot_download
-from huggingface_hub.utils import validate_repo_id, HFValidationError
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from .llm import Config, LLM
 
 
+def _hf_transfer_supported() -> bool:
+    """Checks if `hf_transfer` is installed and used by `huggingface_hub`.
+    `huggingface_hub` 1.0 and later don't use `hf_transfer`."""
+    if find_spec("hf_transfer") is None:
+        return False
+    try:
+        major = int(version("huggingface_hub").split(".")[0])
+    except (PackageNotFoundError, ValueError):
+        return False
+    return major < 1
+
+
+# Use `hf_transfer` for faster downloads when it is supported.
+# Set `HF_HUB_ENABLE_HF_TRANSFER=0` to disable it.
+if _hf_transfer_supported():
+    os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
+
+
 def get_path_type(path: str) -> Optional[str]:
-    p = Path(path)
-    if p.is_file():
+    # Local paths take precedence over repo names such as `foo/bar`.
+    # A single `stat` call is used to check both file and directory.
+    try:
+        mode = os.stat(path).st_mode
+    except (OSError, ValueError):
+        mode = 0
+    if stat.S_ISREG(mode):
         return "file"
-    elif p.is_dir():
+    elif stat.S_ISDIR(mode):
         return "dir"
+
+    # Import only when needed as it is slow to import.
+    from huggingface_hub.utils import validate_repo_id, HFValidationError
+
     try:
         validate_repo_id(path)
         return "repo"
@@ -22,6 +55,76 @@ def get_path_type(path: str) -> Optional[str]:
         pass
 
 
+def _cached_snapshot_download(
+    repo_id: str,
+    allow_patterns: Union[str, List[str]],
+    local_files_only: bool,
+    revision: Optional[str] = None,
+    cache_dir: Optional[str] = None,
+) -> str:
+    """Downloads files from a repo, skipping network requests if the files
+    are already in the local cache."""
+    from huggingface_hub import snapshot_download
+    from huggingface_hub.utils import LocalEntryNotFoundError
+
+    try:
+        path = snapshot_download(
+            repo_id=repo_id,
+            allow_patterns=allow_patterns,
+            local_files_only=True,
+            revision=revision,
+            cache_dir=cache_dir,
+        )
+        if local_files_only:
+            return path
+        # A cached snapshot directory may not contain the requested files.
+        patterns = (
+            [allow_patterns] if isinstance(allow_patterns, str) else allow_patterns
+        )
+        if all(next(Path(path).glob(pattern), None) for pattern in patterns):
+            return path
+    except (LocalEntryNotFoundError, FileNotFoundError):
+        if local_files_only:
+            raise
+    return snapshot_download(
+        repo_id=repo_id,
+        allow_patterns=allow_patterns,
+        revision=revision,
+        cache_dir=cache_dir,
+    )
+
+
+def _cached_hf_hub_download(
+    repo_id: str,
+    filename: str,
+    local_files_only: bool,
+    revision: Optional[str] = None,
+    cache_dir: Optional[str] = None,
+) -> str:
+    """Downloads a file from a repo, skipping network requests if the file is
+    already in the local cache."""
+    from huggingface_hub import hf_hub_download
+    from huggingface_hub.utils import LocalEntryNotFoundError
+
+    try:
+        return hf_hub_download(
+            repo_id=repo_id,
+            filename=filename,
+            local_files_only=True,
+            revision=revision,
+            cache_dir=cache_dir,
+        )
+    except (LocalEntryNotFoundError, FileNotFoundError):
+        if local_files_only:
+            raise
+    return hf_hub_download(
+        repo_id=repo_id,
+        filename=filename,
+        revision=revision,
+        cache_dir=cache_dir,
+    )
+
+
 @dataclass
 class AutoConfig:
     config: Config
@@ -33,12 +136,32 @@ class AutoConfig:
         model_path_or_repo_id: str,
         local_files_only: bool = False,
         revision: Optional[str] = None,
+        cache_dir: Optional[str] = None,
         **kwargs,
     ) -> "AutoConfig":
         path_type = get_path_type(model_path_or_repo_id)
         if not path_type:
             raise ValueError(f"Model path '{model_path_or_repo_id}' doesn't exist.")
 
+        return cls._from_pretrained(
+            model_path_or_repo_id,
+            path_type,
+            local_files_only=local_files_only,
+            revision=revision,
+            cache_dir=cache_dir,
+            **kwargs,
+        )
+
+    @classmethod
+    def _from_pretrained(
+        cls,
+        model_path_or_repo_id: str,
+        path_type: str,
+        local_files_only: bool = False,
+        revision: Optional[str] = None,
+        cache_dir: Optional[str] = None,
+        **kwargs,
+    ) -> "AutoConfig":
         config = Config()
         auto_config = AutoConfig(config=config)
 
@@ -50,6 +173,7 @@ class AutoConfig:
                 auto_config,
                 local_files_only=local_files_only,
                 revision=revision,
+                cache_dir=cache_dir,
             )
 
         for k, v in kwargs.items():
@@ -68,12 +192,14 @@ class AutoConfig:
         auto_config: "AutoConfig",
         local_files_only: bool,
         revision: Optional[str] = None,
+        cache_dir: Optional[str] = None,
     ) -> None:
-        path = snapshot_download(
+        path = _cached_snapshot_download(
             repo_id=repo_id,
             allow_patterns="config.json",
             local_files_only=local_files_only,
             revision=revision,
+            cache_dir=cache_dir,
         )
         cls._update_from_dir(path, auto_config)
 
@@ -85,8 +211,16 @@ class AutoConfig:
 
     @classmethod
     def _update_from_file(cls, path: str, auto_config: "AutoConfig") -> None:
-        with open(path) as f:
-            config = json.load(f)
+        data = Path(path).read_bytes()
+        config = None
+        if orjson:
+            try:
+                config = orjson.loads(data)
+            except orjson.JSONDecodeError:
+                # `orjson` doesn't support `NaN` and `Infinity` values.
+                pass
+        if config is None:
+            config = json.loads(data)
 
         auto_config.model_type = config.get("model_type")
         params = config.get("task_specific_params", {})
@@ -115,6 +249,7 @@ class AutoModelForCausalLM:
         lib: Optional[str] = None,
         local_files_only: bool = False,
         revision: Optional[str] = None,
+        cache_dir: Optional[str] = None,
         hf: bool = False,
         **kwargs,
     ) -> LLM:
@@ -131,6 +266,8 @@ class AutoModelForCausalLM:
             (i.e., do not try to download the model).
             revision: The specific model version to use. It can be a branch
             name, a tag name, or a commit id.
+            cache_dir: The path to a directory in which downloaded models are
+            cached. Default is the Hugging Face Hub cache directory.
             hf: Whether to create a Hugging Face Transformers model.
 
         Returns:
@@ -145,18 +282,24 @@ class AutoModelForCausalLM:
                 model_path_or_repo_id,
                 local_files_only=local_files_only,
                 revision=revision,
+                cache_dir=cache_dir,
                 **kwargs,
             )
 
-        config = config or AutoConfig.from_pretrained(
+        path_type = get_path_type(model_path_or_repo_id)
+        if not path_type:
+            raise ValueError(f"Model path '{model_path_or_repo_id}' doesn't exist.")
+
+        config = config or AutoConfig._from_pretrained(
             model_path_or_repo_id,
+            path_type,
             local_files_only=local_files_only,
             revision=revision,
+            cache_dir=cache_dir,
             **kwargs,
         )
         model_type = model_type or config.model_type
 
-        path_type = get_path_type(model_path_or_repo_id)
         model_path = None
         if path_type == "file":
             model_path = model_path_or_repo_id
@@ -170,6 +313,7 @@ class AutoModelForCausalLM:
                 model_file,
                 local_files_only=local_files_only,
                 revision=revision,
+                cache_dir=cache_dir,
             )
 
         llm = LLM(
@@ -193,27 +337,40 @@ class AutoModelForCausalLM:
         filename: Optional[str],
         local_files_only: bool,
         revision: Optional[str] = None,
+        cache_dir: Optional[str] = None,
     ) -> str:
         if not filename and not local_files_only:
             filename = cls._find_model_file_from_repo(
                 repo_id=repo_id,
                 revision=revision,
             )
-        allow_patterns = filename or ["*.bin", "*.gguf"]
-        path = snapshot_download(
+        if filename:
+            path = _cached_hf_hub_download(
+                repo_id=repo_id,
+                filename=filename,
+                local_files_only=local_files_only,
+                revision=revision,
+                cache_dir=cache_dir,
+            )
+            return str(Path(path).resolve())
+        path = _cached_snapshot_download(
             repo_id=repo_id,
-            allow_patterns=allow_patterns,
+            allow_patterns=["*.bin", "*.gguf"],
             local_files_only=local_files_only,
             revision=revision,
+            cache_dir=cache_dir,
         )
-        return cls._find_model_path_from_dir(path, filename=filename)
+        return cls._find_model_path_from_dir(path)
 
     @classmethod
     def _find_model_file_from_repo(
         cls,
         repo_id: str,
         revision: Optional[str] = None,
+        extensions: Tuple[str, ...] = (".bin", ".gguf"),
     ) -> Optional[str]:
+        from huggingface_hub import HfApi
+
         api = HfApi()
         repo_info = api.repo_info(
             repo_id=repo_id,
@@ -223,7 +380,7 @@ class AutoModelForCausalLM:
         files = [
             (f.size, f.rfilename)
             for f in repo_info.siblings
-            if f.rfilename.endswith(".bin") or f.rfilename.endswith(".gguf")
+            if f.rfilename.endswith(extensions)
         ]
         if not files:
             raise ValueError(f"No model file found in repo '{repo_id}'")
@@ -242,15 +399,19 @@ class AutoModelForCausalLM:
                 raise ValueError(f"Model file '{filename}' not found in '{path}'")
             return str(file)
 
-        files = [
-            (f.stat().st_size, f)
-            for f in path.iterdir()
-            if f.is_file() and (f.name.endswith(".bin") or f.name.endswith(".gguf"))
-        ]
+        # Files are filtered by name before `is_file()` and `stat()`, so only
+        # model files are stat'ed. Symlinks (as in the Hugging Face Hub cache)
+        # are still stat'ed to get the file type and size of their targets.
+        with os.scandir(path) as entries:
+            files = [
+                (entry.stat().st_size, entry.path)
+                for entry in entries
+                if entry.name.endswith((".bin", ".gguf")) and entry.is_file()
+            ]
         if not files:
             raise ValueError(f"No model file found in directory '{path}'")
         file = min(files)[1]
-        return str(file.resolve())
+        return str(Path(file).resolve())
 
 
 class AutoTokenizer:
@@ -1,11 +1,13 @@
 import platform
 from ctypes import CDLL
+from functools import lru_cache
 from typing import List, Optional
 from pathlib import Path
 
 from .logger import logger
 
 
+@lru_cache(maxsize=4)
 def find_library(path: Optional[str] = None, gpu: bool = False) -> str:
     lib_directory = Path(__file__).parent.resolve() / "lib"
 
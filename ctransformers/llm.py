@@ -2,9 +2,10 @@ import inspect
 import os
 import re
 import warnings
+from array import array
 from collections import OrderedDict
 from dataclasses import dataclass
-from functools import partial
+from functools import lru_cache, partial
 from pathlib import Path
 from ctypes import (
     CDLL,
@@ -34,6 +35,8 @@ c_int_p = POINTER(c_int)
 c_float_p = POINTER(c_float)
 llm_p = c_void_p
 
+TOKENIZE_CACHE_SIZE = 32
+
 
 @dataclass
 class Config:
@@ -115,16 +118,25 @@ def get(*values):
 
 
 def load_library(path: Optional[str] = None, gpu: bool = False) -> Any:
+    path = find_library(path, gpu=gpu)
+    return _load_library(path)
+
+
+@lru_cache(maxsize=8)
+def _load_library(path: str) -> Any:
     # https://docs.python.org/3.8/whatsnew/3.8.html#bpo-36085-whatsnew
     # https://github.com/abetlen/llama-cpp-python/pull/225
     if hasattr(os, "add_dll_directory") and "CUDA_PATH" in os.environ:
         os.add_dll_directory(os.path.join(os.environ["CUDA_PATH"], "bin"))
 
-    path = find_library(path, gpu=gpu)
     if "cuda" in path:
         load_cuda()
     lib = CDLL(path)
+    _configure_lib(lib)
+    return lib
 
+
+def _configure_lib(lib: Any) -> None:
     lib.ctransformers_llm_create.argtypes = [
         c_char_p,  # model_path
         c_char_p,  # model_type
@@ -205,7 +217,22 @@ def load_library(path: Optional[str] = None, gpu: bool = False) -> Any:
     lib.ctransformers_llm_reset.argtypes = [llm_p]
     lib.ctransformers_llm_reset.restype = None
 
-    return lib
+
+def to_c_int_array(values: Sequence[int]) -> Any:
+    """Converts a sequence of integers to a C int array. Objects supporting
+    the buffer protocol with C int items (such as `array.array("i")` or int32
+    NumPy arrays) are passed to C without unpacking each item.
+    """
+    try:
+        view = memoryview(values)
+    except TypeError:
+        view = None
+    if view is not None and view.format == "i" and view.ndim == 1 and view.contiguous:
+        type_ = c_int * len(view)
+        if view.readonly:
+            return type_.from_buffer_copy(view)
+        return type_.from_buffer(view)
+    return (c_int * len(values))(*values)
 
 
 class LLM:
@@ -230,7 +257,9 @@ class LLM:
         self._config = config
         self._llm = None
         self._lib = None
-        self._context = []
+        self._context = array("i")
+        self._one_token = (c_int * 1)()
+        self._tokenize_cache = OrderedDict()
 
         if not Path(model_path).is_file():
             raise ValueError(f"Model path '{model_path}' doesn't exist.")
@@ -317,7 +346,11 @@ class LLM:
     def __getattr__(self, name: str) -> Callable:
         lib, llm = self._lib, self._llm
         if name.startswith("ctransformers_llm_") and hasattr(lib, name):
-            return partial(getattr(lib, name), llm)
+            # Cache the bound function on the instance so that future lookups
+            # don't go through `__getattr__`.
+            fn = partial(getattr(lib, name), llm)
+            setattr(self, name, fn)
+            return fn
         raise AttributeError(f"'LLM' object has no attribute '{name}'")
 
     def tokenize(self, text: str, add_bos_token: Optional[bool] = None) -> List[int]:
@@ -330,11 +363,32 @@ class LLM:
         Returns:
             The list of tokens.
         """
+        return self._tokenize(text, add_bos_token=add_bos_token).tolist()
+
+    def _tokenize(self, text: str, add_bos_token: Optional[bool] = None) -> array:
+        """Converts a text into an array of C ints which can be evaluated
+        without creating an int object per token."""
         if add_bos_token is None:
             add_bos_token = self.model_type == "llama"
-        tokens = (c_int * (len(text) + 1))()
-        n_tokens = self.ctransformers_llm_tokenize(text.encode(), add_bos_token, tokens)
-        return tokens[:n_tokens]
+
+        # Reuse tokens of recently tokenized texts such as repeated prompts.
+        key = (text, add_bos_token)
+        cache = self._tokenize_cache
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key][:]
+
+        text = text.encode()
+        # A text can't have more tokens than bytes (plus the BOS token).
+        output = (c_int * (len(text) + 1))()
+        n_tokens = self.ctransformers_llm_tokenize(text, add_bos_token, output)
+        tokens = array("i")
+        tokens.frombytes(memoryview(output).cast("B")[: n_tokens * tokens.itemsize])
+
+        cache[key] = tokens
+        if len(cache) > TOKENIZE_CACHE_SIZE:
+            cache.popitem(last=False)
+        return tokens[:]
 
     def detokenize(
         self,
@@ -352,11 +406,8 @@ class LLM:
         """
         if isinstance(tokens, int):
             tokens = [tokens]
-        texts = []
-        for token in tokens:
-            text = self.ctransformers_llm_detokenize(token)
-            texts.append(text)
-        texts = b"".join(texts)
+        detokenize = self.ctransformers_llm_detokenize
+        texts = b"".join([detokenize(token) for token in tokens])
         if decode:
             texts = texts.decode(errors="ignore")
             # https://github.com/ggerganov/llama.cpp/blob/43033b7bb4858da4f591715b3babdf906c9b7cbc/common/common.cpp#L778-L781
@@ -393,13 +444,27 @@ class LLM:
         batch_size = get(batch_size, config.batch_size)
         threads = get(threads, config.threads)
 
+        tokens = to_c_int_array(tokens)
+        self._batch_eval(tokens, len(tokens), batch_size, threads)
+
+    def _eval_one(self, token: int, batch_size: int, threads: int) -> None:
+        """Evaluates a single token without creating a new ctypes array."""
+        self._one_token[0] = token
+        self._batch_eval(self._one_token, 1, batch_size, threads)
+
+    def _batch_eval(
+        self,
+        tokens: Any,
+        n_tokens: int,
+        batch_size: int,
+        threads: int,
+    ) -> None:
+        """Evaluates a C int array of tokens and updates the LLM context."""
         n_past = len(self._context)
-        n_tokens = len(tokens)
         if n_past + n_tokens > self.context_length:
             logger.warning(
                 f"Number of tokens ({n_past + n_tokens}) exceeded maximum context length ({self.context_length})."
             )
-        tokens = (c_int * n_tokens)(*tokens)
         status = self.ctransformers_llm_batch_eval(
             tokens,
             n_tokens,
@@ -409,7 +474,7 @@ class LLM:
         )
         if not status:
             raise RuntimeError("Failed to evaluate tokens.")
-        self._context.extend(tokens)
+        self._context.frombytes(memoryview(tokens).cast("B"))
 
     @doc
     def sample(
@@ -442,7 +507,7 @@ class LLM:
             last_n_tokens = self.context_length
         last_tokens = self._context[-last_n_tokens:]
         n_last = len(last_tokens)
-        last_tokens = (c_int * n_last)(*last_tokens)
+        last_tokens = to_c_int_array(last_tokens)
 
         return self.ctransformers_llm_sample(
             last_tokens,
@@ -459,7 +524,8 @@ class LLM:
         warnings.warn(
             "`LLM.reset()` method is deprecated since 0.2.27. Please use high-level API."
         )
-        self._context.clear()
+        del self._context[:]
+        self._tokenize_cache.clear()
         self.ctransformers_llm_reset()
 
     def __del__(self):
@@ -523,6 +589,10 @@ class LLM:
         Returns:
             The generated tokens.
         """
+        config = self.config
+        batch_size = get(batch_size, config.batch_size)
+        threads = get(threads, config.threads)
+
         tokens = self.prepare_inputs_for_generation(tokens, reset=reset)
         self.eval(tokens, batch_size=batch_size, threads=threads)
         while True:
@@ -534,7 +604,7 @@ class LLM:
                 last_n_tokens=last_n_tokens,
                 seed=seed,
             )
-            self.eval([token], batch_size=batch_size, threads=threads)
+            self._eval_one(token, batch_size, threads)
             if self.is_eos_token(token):
                 break
             yield token
@@ -561,13 +631,8 @@ class LLM:
         if isinstance(stop, str):
             stop = [stop]
 
-        tokens = self.tokenize(prompt)
-
-        stop_regex = re.compile("|".join(map(re.escape, stop)))
-        count = 0
-        text = ""
-        incomplete = b""
-        for token in self.generate(
+        tokens = self._tokenize(prompt)
+        tokens = self.generate(
             tokens,
             top_k=top_k,
             top_p=top_p,
@@ -578,30 +643,69 @@ class LLM:
             batch_size=batch_size,
             threads=threads,
             reset=reset,
-        ):
+        )
+        if stop:
+            yield from self._stream_with_stop(tokens, max_new_tokens, stop)
+        else:
+            yield from self._stream_no_stop(tokens, max_new_tokens)
+
+    def _stream_no_stop(
+        self,
+        tokens: Generator[int, None, None],
+        max_new_tokens: int,
+    ) -> Generator[str, None, None]:
+        count = 0
+        incomplete = b""
+        for token in tokens:
+            # Handle incomplete UTF-8 multi-byte characters.
+            incomplete += self.detokenize([token], decode=False)
+            complete, incomplete = utf8_split_incomplete(incomplete)
+            text = complete.decode(errors="ignore")
+            if text:
+                yield text
+
+            count += 1
+            if count >= max_new_tokens:
+                break
+
+    def _stream_with_stop(
+        self,
+        tokens: Generator[int, None, None],
+        max_new_tokens: int,
+        stop: Sequence[str],
+    ) -> Generator[str, None, None]:
+        stop_regex = re.compile("|".join(map(re.escape, stop)))
+        # All non-empty prefixes of stop sequences, longest first.
+        prefixes = {s[:i] for s in stop for i in range(1, len(s) + 1)}
+        prefixes = tuple(sorted(prefixes, key=len, reverse=True))
+        max_stop_len = max(map(len, stop))
+        count = 0
+        text = ""
+        incomplete = b""
+        for token in tokens:
             # Handle incomplete UTF-8 multi-byte characters.
             incomplete += self.detokenize([token], decode=False)
             complete, incomplete = utf8_split_incomplete(incomplete)
+            # The text held back from previous tokens doesn't contain a stop
+            # sequence, so a new match must overlap the newly generated text.
+            # An empty stop sequence matches at the end of the held back text.
+            start = max(0, len(text) - max(max_stop_len - 1, 0))
             text += complete.decode(errors="ignore")
 
             # https://github.com/abetlen/llama-cpp-python/blob/1a13d76c487df1c8560132d10bda62d6e2f4fa93/llama_cpp/llama.py#L686-L706
             # Check if one of the stop sequences is part of the text.
             # Note that the stop sequence may not always be at the end of text.
-            if stop:
-                match = stop_regex.search(text)
-                if match:
-                    text = text[: match.start()]
-                    break
+            match = stop_regex.search(text, start)
+            if match:
+                text = text[: match.start()]
+                break
 
             # Avoid sending the longest suffix of text which is also a prefix
             # of a stop sequence, as it can form a stop sequence with the text
             # generated later.
             longest = 0
-            for s in stop:
-                for i in range(len(s), 0, -1):
-                    if text.endswith(s[:i]):
-                        longest = max(i, longest)
-                        break
+            if text.endswith(prefixes):
+                longest = next(len(p) for p in prefixes if text.endswith(p))
 
             end = len(text) - longest
             if end > 0:
@@ -683,7 +787,7 @@ class LLM:
             The input embeddings.
         """
         if isinstance(input, str):
-            input = self.tokenize(input)
+            input = self._tokenize(input)
         input = self.prepare_inputs_for_generation(input, reset=True)
         self.eval(input, batch_size=batch_size, threads=threads)
         return list(self.embeddings)
@@ -43,6 +43,9 @@ setup(
         "gptq": [
             "exllama==0.1.0",
         ],
+        "orjson": [
+            "orjson",
+        ],
         "tests": [
             "pytest",
         ],
@@ -0,0 +1,161 @@
+from pathlib import Path
+from types import SimpleNamespace
+
+import huggingface_hub
+import pytest
+from huggingface_hub.utils import LocalEntryNotFoundError
+
+from ctransformers.hub import (
+    AutoConfig,
+    AutoModelForCausalLM,
+    _cached_hf_hub_download,
+    _cached_snapshot_download,
+)
+
+REPO_ID = "user/repo"
+COMMIT = "0" * 40
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    repo = tmp_path / "models--user--repo"
+    (repo / "refs").mkdir(parents=True)
+    (repo / "refs" / "main").write_text(COMMIT)
+    snapshot = repo / "snapshots" / COMMIT
+    snapshot.mkdir(parents=True)
+    (snapshot / "config.json").write_text("{}")
+    (snapshot / "m.bin").write_bytes(b"model")
+    return str(tmp_path)
+
+
+@pytest.fixture
+def downloads(monkeypatch):
+    """Records network downloads instead of making them."""
+    calls = []
+
+    def download(fn):
+        def wrapper(*args, **kwargs):
+            if kwargs.get("local_files_only"):
+                return fn(*args, **kwargs)
+            calls.append(kwargs)
+            return "downloaded"
+
+        return wrapper
+
+    for name in ["snapshot_download", "hf_hub_download"]:
+        fn = getattr(huggingface_hub, name)
+        monkeypatch.setattr(huggingface_hub, name, download(fn))
+
+    def repo_info(*args, **kwargs):
+        raise AssertionError("Unexpected network request.")
+
+    monkeypatch.setattr(huggingface_hub.HfApi, "repo_info", repo_info)
+    return calls
+
+
+class TestHub:
+    def test_cached_snapshot_download(self, cache_dir, downloads):
+        for local_files_only in [False, True]:
+            path = _cached_snapshot_download(
+                REPO_ID,
+                "config.json",
+                local_files_only=local_files_only,
+                cache_dir=cache_dir,
+            )
+            assert path.endswith(COMMIT)
+        assert not downloads
+
+        # Cached snapshot directory doesn't contain all the requested files.
+        for patterns in [["*.gguf"], ["config.json", "*.gguf"]]:
+            path = _cached_snapshot_download(
+                REPO_ID,
+                patterns,
+                local_files_only=False,
+                cache_dir=cache_dir,
+            )
+            assert path == "downloaded"
+        assert len(downloads) == 2
+
+        path = _cached_snapshot_download(
+            REPO_ID,
+            ["*.gguf"],
+            local_files_only=True,
+            cache_dir=cache_dir,
+        )
+        assert path.endswith(COMMIT)
+
+    def test_cached_snapshot_download_missing_repo(self, cache_dir, downloads):
+        with pytest.raises(LocalEntryNotFoundError):
+            _cached_snapshot_download(
+                "user/other",
+                "config.json",
+                local_files_only=True,
+                cache_dir=cache_dir,
+            )
+        path = _cached_snapshot_download(
+            "user/other",
+            "config.json",
+            local_files_only=False,
+            cache_dir=cache_dir,
+        )
+        assert path == "downloaded"
+
+    def test_cached_hf_hub_download(self, cache_dir, downloads):
+        path = _cached_hf_hub_download(
+            REPO_ID,
+            "m.bin",
+            local_files_only=False,
+            cache_dir=cache_dir,
+        )
+        assert path.endswith("m.bin")
+        assert not downloads
+
+        with pytest.raises(LocalEntryNotFoundError):
+            _cached_hf_hub_download(
+                REPO_ID,
+                "other.bin",
+                local_files_only=True,
+                cache_dir=cache_dir,
+            )
+        path = _cached_hf_hub_download(
+            REPO_ID,
+            "other.bin",
+            local_files_only=False,
+            cache_dir=cache_dir,
+        )
+        assert path == "downloaded"
+
+    def test_find_model_path_from_repo(self, cache_dir, downloads, monkeypatch):
+        def repo_info(*args, **kwargs):
+            files = {"config.json": 2, "m.bin": 1000, "q2.bin": 10}
+            siblings = [SimpleNamespace(rfilename=k, size=v) for k, v in files.items()]
+            return SimpleNamespace(siblings=siblings)
+
+        monkeypatch.setattr(huggingface_hub.HfApi, "repo_info", repo_info)
+
+        # Only a larger model file is cached.
+        path = AutoModelForCausalLM._find_model_path_from_repo(
+            REPO_ID,
+            None,
+            local_files_only=False,
+            cache_dir=cache_dir,
+        )
+        assert [d["filename"] for d in downloads] == ["q2.bin"]
+
+        # The smallest model file in repo is cached.
+        snapshot = Path(cache_dir) / "models--user--repo" / "snapshots" / COMMIT
+        (snapshot / "q2.bin").write_bytes(b"q2")
+        for local_files_only in [False, True]:
+            path = AutoModelForCausalLM._find_model_path_from_repo(
+                REPO_ID,
+                None,
+                local_files_only=local_files_only,
+                cache_dir=cache_dir,
+            )
+            assert path.endswith("q2.bin")
+        assert len(downloads) == 1
+
+    def test_config_nan(self, tmp_path):
+        (tmp_path / "config.json").write_text('{"model_type": "gpt2", "x": NaN}')
+        config = AutoConfig.from_pretrained(str(tmp_path))
+        assert config.model_type == "gpt2"
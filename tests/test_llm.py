@@ -1,4 +1,10 @@
+from array import array
+from collections import OrderedDict
+
+import pytest
+
 from ctransformers import LLM, Config
+from ctransformers.llm import TOKENIZE_CACHE_SIZE, to_c_int_array
 
 
 class MockLLM(LLM):
@@ -10,9 +16,9 @@ class MockLLM(LLM):
     def config(self):
         return self._config
 
-    def tokenize(self, prompt, **kwargs):
+    def _tokenize(self, prompt, **kwargs):
         self.tokens = prompt.split(" ")
-        return range(len(self.tokens))
+        return array("i", range(len(self.tokens)))
 
     def generate(self, tokens, **kwargs):
         return tokens
@@ -24,6 +30,36 @@ class MockLLM(LLM):
         return text
 
 
+class MockTokenizerLLM(LLM):
+    def __init__(self):
+        self._config = Config()
+        self._llm = None
+        self._model_type = "gpt2"
+        self._context = array("i")
+        self._tokenize_cache = OrderedDict()
+        self.texts = []
+        self.evaluated = []
+
+    def ctransformers_llm_tokenize(self, text, add_bos_token, output):
+        self.texts.append(text)
+        for i, byte in enumerate(text):
+            output[i] = byte
+        return len(text)
+
+    def ctransformers_llm_reset(self):
+        pass
+
+    def ctransformers_llm_context_length(self):
+        return 100
+
+    def ctransformers_llm_batch_eval(self, tokens, n_tokens, *args):
+        self.evaluated.append(list(tokens[:n_tokens]))
+        return True
+
+    def ctransformers_llm_sample(self, last_tokens, n_last, *args):
+        return list(last_tokens[:n_last])
+
+
 class TestLLM:
     def test_stop(self):
         llm = MockLLM()
@@ -52,3 +88,64 @@ class TestLLM:
             assert llm(prompt, stop=stop) == response
             if len(stop) == 1:
                 assert llm(prompt, stop=stop[0]) == response
+
+        # An empty stop sequence matches before any generated text.
+        assert llm(prompt, stop=[""]) == ""
+        assert llm(prompt, stop=["", "foo"]) == ""
+
+    def test_tokenize_cache(self):
+        llm = MockTokenizerLLM()
+        tokens = llm.tokenize("foo")
+        assert tokens == [102, 111, 111]
+        tokens.append(0)
+        assert llm.tokenize("foo") == [102, 111, 111]
+        assert llm.texts == [b"foo"]
+        tokens = llm._tokenize("foo")
+        assert tokens == array("i", [102, 111, 111])
+        tokens[0] = 0
+        assert llm.tokenize("foo") == [102, 111, 111]
+        assert llm.texts == [b"foo"]
+
+        for i in range(TOKENIZE_CACHE_SIZE):
+            llm.tokenize(str(i))
+        assert len(llm._tokenize_cache) == TOKENIZE_CACHE_SIZE
+        llm.tokenize("foo")
+        assert llm.texts[-1] == b"foo"
+        assert len(llm.texts) == TOKENIZE_CACHE_SIZE + 2
+
+        with pytest.warns(UserWarning):
+            llm.reset()
+        assert not llm._tokenize_cache
+        llm.tokenize("foo")
+        assert len(llm.texts) == TOKENIZE_CACHE_SIZE + 3
+
+    def test_to_c_int_array(self):
+        for values in [[1, 2, 3], (1, 2, 3), range(1, 4), array("l", [1, 2, 3])]:
+            assert list(to_c_int_array(values)) == [1, 2, 3]
+        for values in [[], range(0), array("i"), b""]:
+            assert list(to_c_int_array(values)) == []
+
+        # Shares memory with writable buffers.
+        values = array("i", [1, 2, 3])
+        c_array = to_c_int_array(values)
+        c_array[0] = 4
+        assert values[0] == 4
+
+        # Copies read-only buffers.
+        data = array("i", [1, 2, 3]).tobytes()
+        values = memoryview(data).cast("i")
+        c_array = to_c_int_array(values)
+        assert list(c_array) == [1, 2, 3]
+        c_array[0] = 4
+        assert values[0] == 1
+
+    def test_eval(self):
+        llm = MockTokenizerLLM()
+        llm.eval(llm._tokenize("foo"))
+        llm.eval([1, 2])
+        assert llm.evaluated == [[102, 111, 111], [1, 2]]
+        assert llm._context == array("i", [102, 111, 111, 1, 2])
+        assert llm.sample(last_n_tokens=3) == [111, 1, 2]
+
+        assert llm.prepare_inputs_for_generation([102, 111, 5]) == [5]
+        assert llm._context == array("i", [102, 111])